@@ -1,8 +1,22 @@
-import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
+
 import numpy as np
-import pandas as pd
+import simdjson
+import matplotlib
+
+matplotlib.use("Agg")  # headless backend; safe to render from worker processes
+# Let the renderer drop visually redundant vertices when the line plots
+# span tens of thousands of generations.
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.colors import ListedColormap
+from scipy.stats import gaussian_kde
 
 SUMMARY_FILE = "summary_data.jsonl"
 WORLD_FILE = "world_data.jsonl"
@@ -11,240 +25,463 @@ BIOME_NAMES = ["Forest", "Desert", "Water", "Grassland"]
 BIOME_IDX = {name: i for i, name in enumerate(BIOME_NAMES)}
 BIOME_COLORS = {0: "green", 1: "yellow", 2: "blue", 3: "brown"}
 
-# ---------------------------------------------------------------------------
-# 1. Time-series stats from summary_data.jsonl (lightweight, pre-aggregated)
-# ---------------------------------------------------------------------------
-gen_list = []
-organism_counts = []
-predator_counts = []
-organism_avg_size_list = []
-organism_avg_speed_list = []
-organism_avg_energy_list = []
-organism_avg_reproduction_threshold_list = []
-predator_avg_size_list = []
-predator_avg_speed_list = []
-predator_avg_energy_list = []
-predator_avg_reproduction_threshold_list = []
-predator_avg_hunting_efficiency_list = []
-predator_avg_satiation_threshold_list = []
-average_food_per_generation = []
-# biome_tally values are avg biome tolerance sums per generation
-biome_tolerance_avg = {name: [] for name in BIOME_NAMES}
-
-with open(SUMMARY_FILE) as f:
-    for line in f:
-        if not line.strip():
-            continue
-        d = json.loads(line)
-        gen_list.append(d["generation"])
-        organism_counts.append(d["organism_count"])
-        predator_counts.append(d["predator_count"])
-        organism_avg_size_list.append(d["organism_avg_size"])
-        organism_avg_speed_list.append(d["organism_avg_speed"])
-        organism_avg_energy_list.append(max(d["organism_avg_energy"], 0))
-        organism_avg_reproduction_threshold_list.append(d["organism_avg_reproduction_threshold"])
-        predator_avg_size_list.append(d["predator_avg_size"])
-        predator_avg_speed_list.append(d["predator_avg_speed"])
-        predator_avg_energy_list.append(max(d["predator_avg_energy"], 0))
-        predator_avg_reproduction_threshold_list.append(d["predator_avg_reproduction_threshold"])
-        predator_avg_hunting_efficiency_list.append(d["predator_avg_hunting_efficiency"])
-        predator_avg_satiation_threshold_list.append(d["predator_avg_satiation_threshold"])
-        average_food_per_generation.append(d["average_food"])
-        tally = d["biome_tally"]
-        for name in BIOME_NAMES:
-            biome_tolerance_avg[name].append(tally.get(name, 0.0))
-
-print(f"Loaded {len(gen_list)} generations from {SUMMARY_FILE}")
+# Sorted biome names plus the permutation back to canonical order, for
+# vectorized string->id mapping via np.searchsorted.
+_BIOME_SORT = np.argsort(BIOME_NAMES)
+_BIOME_SORTED_NAMES = np.array(BIOME_NAMES)[_BIOME_SORT]
+
+# Reused simdjson parser: parses each line onto an internal tape without
+# materializing Python dicts. Documents are only valid until the next
+# parse() call, so anything kept across lines must be copied out.
+_parser = simdjson.Parser()
+
+# Scalar fields read from each summary line, in column order. The biome
+# tolerance sums are appended as four extra columns after these.
+SUMMARY_FIELDS = (
+    "generation",
+    "organism_count",
+    "predator_count",
+    "organism_avg_size",
+    "organism_avg_speed",
+    "organism_avg_energy",
+    "organism_avg_reproduction_threshold",
+    "predator_avg_size",
+    "predator_avg_speed",
+    "predator_avg_energy",
+    "predator_avg_reproduction_threshold",
+    "predator_avg_hunting_efficiency",
+    "predator_avg_satiation_threshold",
+    "average_food",
+)
+
+# Fetches all scalar summary fields from a parsed line in one C call
+# instead of one __getitem__ per field.
+_GET_SUMMARY_SCALARS = itemgetter(*SUMMARY_FIELDS)
+
+
+def load_cached(path, loader):
+    """Memoize loader(path) — a dict of arrays — in an .npz sidecar keyed
+    by the source file's mtime, so plot-tweak reruns skip the JSONL parse
+    entirely."""
+    cache_path = path + ".npz"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        print(f"Using cached arrays from {cache_path}")
+        with np.load(cache_path) as arrs:
+            return {k: arrs[k] for k in arrs.files}
+    data = loader(path)
+    np.savez_compressed(cache_path, **data)
+    return data
+
+
+def load_summary_data(path):
+    """Parse summary_data.jsonl into one (n_gens, 18) array: the scalar
+    SUMMARY_FIELDS columns followed by the four biome tolerance sums."""
+    with open(path) as f:
+        n_gens = sum(1 for line in f if line.strip())
+
+    # One row per generation, filled in a single pass over the file so
+    # each line is parsed and walked exactly once.
+    summary = np.empty((n_gens, len(SUMMARY_FIELDS) + len(BIOME_NAMES)))
+
+    gi = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            d = _parser.parse(line)
+            tally = d["biome_tally"]
+            summary[gi, : len(SUMMARY_FIELDS)] = _GET_SUMMARY_SCALARS(d)
+            summary[gi, len(SUMMARY_FIELDS):] = (
+                tally.get("Forest", 0.0),
+                tally.get("Desert", 0.0),
+                tally.get("Water", 0.0),
+                tally.get("Grassland", 0.0),
+            )
+            gi += 1
+            del d, tally  # release the parser tape before the next parse()
+
+    # Clamp the avg-energy columns in one vectorized pass; the sim can log
+    # small negative averages.
+    for field in ("organism_avg_energy", "predator_avg_energy"):
+        j = SUMMARY_FIELDS.index(field)
+        np.maximum(summary[:, j], 0.0, out=summary[:, j])
+
+    print(f"Loaded {n_gens} generations from {path}")
+    return {"summary": summary}
+
+
+def _parse_world_range(args):
+    """Worker: parse the [start, end) byte range of world_data.jsonl
+    (newline-aligned by the caller) and return the partial population
+    counts for those snapshots plus the number of lines seen."""
+    path, start, end, width, height = args
+    parser = simdjson.Parser()
+    # Per-snapshot flat row-major position indices (SoA); reduced with one
+    # bincount before crossing the process boundary.
+    idx_per_gen = []
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line.strip():
+                continue
+            d = parser.parse(line)
+            organisms = d["organisms"]
+            predators = d["predators"]
+            n = len(organisms) + len(predators)
+            # one walk per entity, resolving e["position"] a single time
+            idx_per_gen.append(np.fromiter(
+                (
+                    p["y"] * width + p["x"]
+                    for e in chain(organisms, predators)
+                    for p in (e["position"],)
+                ),
+                dtype=np.intp,
+                count=n,
+            ))
+            del d, organisms, predators  # release the parser tape before the next parse()
+
+    if not idx_per_gen:
+        return np.zeros(width * height, dtype=np.intp), 0
+    # bincount on flat row-major indices is faster than an np.add.at scatter
+    counts = np.bincount(np.concatenate(idx_per_gen), minlength=width * height)
+    return counts, len(idx_per_gen)
+
+
+def _read_last_line(path):
+    """Return the last non-empty line of the file without reading it all."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        while end > 0 and mm[end - 1] in b" \t\r\n":
+            end -= 1
+        start = mm.rfind(b"\n", 0, end) + 1
+        return mm[start:end]
+
+
+def load_world_data(path):
+    """Parse world_data.jsonl, returning the world dimensions, the biome
+    grid, the cumulative population heatmap and the final food snapshot.
+
+    The first line supplies config/grid and the last line the food grid;
+    the per-snapshot position gathering — the bulk of the work — is
+    fanned out over worker processes on newline-aligned byte ranges,
+    since JSON parsing is CPU-bound and GIL-heavy."""
+    with open(path, "rb") as f:
+        first_line = f.readline()
+        while first_line and not first_line.strip():
+            first_line = f.readline()
+
+    d = _parser.parse(first_line)
+    width = d["config"]["width"]
+    height = d["config"]["height"]
+    flat_tiles = d["world"]["grid"]  # flat Vec<Tile>, row-major y*width+x
+    names = np.array([t["biome"] for t in flat_tiles])
+    world_biome_grid = _BIOME_SORT[
+        np.searchsorted(_BIOME_SORTED_NAMES, names)
+    ].reshape(height, width)
+    del d, flat_tiles, names
+
+    # Cut the file into one newline-aligned byte range per core.
+    size = os.path.getsize(path)
+    n_workers = os.cpu_count() or 1
+    with open(path, "rb") as f:
+        cuts = {0, size}
+        for i in range(1, n_workers):
+            f.seek(size * i // n_workers)
+            f.readline()  # advance to the next line start
+            cuts.add(min(f.tell(), size))
+    cuts = sorted(cuts)
+    ranges = [(path, s, e, width, height) for s, e in zip(cuts, cuts[1:]) if s < e]
+
+    if len(ranges) == 1:
+        results = [_parse_world_range(ranges[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            results = list(executor.map(_parse_world_range, ranges))
+
+    heatmap_grid = (
+        sum(counts for counts, _ in results)
+        .reshape(height, width)
+        .astype(np.float64)
+    )
+    lines_processed = sum(n for _, n in results)
+
+    # flat [f32] array, same row-major layout as the grid; as_buffer
+    # copies the homogeneous array in C
+    last_food = np.frombuffer(
+        _parser.parse(_read_last_line(path))["food"].as_buffer(of_type="d")
+    )
+
+    print(f"Loaded {lines_processed} world snapshots from {path}")
+    return {
+        "dims": np.array([width, height]),
+        "biome_grid": world_biome_grid,
+        "heatmap": heatmap_grid,
+        "food": last_food.reshape(height, width),
+    }
 
-# ---------------------------------------------------------------------------
-# 2. Spatial data from world_data.jsonl (biome map, heatmaps)
-# ---------------------------------------------------------------------------
-width = height = None
-heatmap_grid = None
-last_food = None
-world_biome_grid = None
-lines_processed = 0
-
-with open(WORLD_FILE) as f:
-    for line in f:
-        if not line.strip():
-            continue
-        d = json.loads(line)
-
-        if width is None:
-            width = d["config"]["width"]
-            height = d["config"]["height"]
-            heatmap_grid = np.zeros((height, width))
-            flat_tiles = d["world"]["grid"]  # flat Vec<Tile>, row-major y*width+x
-            world_biome_grid = np.array(
-                [BIOME_IDX[t["biome"]] for t in flat_tiles], dtype=int
-            ).reshape(height, width)
-
-        for org in d["organisms"]:
-            heatmap_grid[org["position"]["y"], org["position"]["x"]] += 1
-        for pred in d["predators"]:
-            heatmap_grid[pred["position"]["y"], pred["position"]["x"]] += 1
-
-        last_food = d["food"]  # flat [f32] array, same row-major layout
-        lines_processed += 1
-        if lines_processed % 100 == 0:
-            print(f"  world entries processed: {lines_processed}")
-
-print(f"Loaded {lines_processed} world snapshots from {WORLD_FILE}")
 
 # ---------------------------------------------------------------------------
-# 3. Plots
+# 3. Plot renderers — one figure each, independent once the arrays exist,
+# so main() can fan them out across worker processes.
 # ---------------------------------------------------------------------------
 
-# Biome map
-fig, ax = plt.subplots(figsize=(max(width / 10, 4), max(height / 10, 4)))
-for y in range(height):
-    for x in range(width):
-        color = BIOME_COLORS[world_biome_grid[y, x]]
-        ax.add_patch(plt.Rectangle((x, y), 1, 1, color=color))
-ax.set_xlim(0, width)
-ax.set_ylim(0, height)
-ax.set_aspect("equal")
-ax.set_title("World Biome Map")
-ax.set_xlabel("X Position")
-ax.set_ylabel("Y Position")
-ax.legend(
-    handles=[
-        plt.Line2D([0], [0], marker="o", color="w", label=name, markerfacecolor=BIOME_COLORS[i])
-        for name, i in BIOME_IDX.items()
-    ],
-    loc="upper right",
-)
-plt.tight_layout()
-plt.savefig("world_biome_map.png")
-plt.close()
-
-# Population over time
-plt.figure(figsize=(10, 5))
-plt.plot(gen_list, organism_counts, label="Preys", color="lime", linewidth=2)
-plt.plot(gen_list, predator_counts, label="Predators", color="red", linewidth=2)
-plt.xlabel("Generation")
-plt.ylabel("Population")
-plt.title("Population Over Time")
-plt.legend()
-plt.grid(True)
-plt.savefig("population_trends.png")
-plt.close()
-
-# Population heatmap
-plt.figure(figsize=(8, 6))
-sns.heatmap(heatmap_grid, cmap="hot", square=True)
-plt.title("Population Heatmap (cumulative)")
-plt.xlabel("X")
-plt.ylabel("Y")
-plt.savefig("population_heatmap.png")
-plt.close()
-
-# Energy distribution
-plt.figure(figsize=(10, 5))
-sns.histplot(organism_avg_energy_list, bins=30, color="lime", alpha=0.7, label="Preys", kde=True)
-sns.histplot(predator_avg_energy_list, bins=30, color="red", alpha=0.7, label="Predators", kde=True)
-plt.xlabel("Avg Energy")
-plt.ylabel("Frequency")
-plt.title("Energy Distribution of Preys and Predators")
-plt.legend()
-plt.grid(True)
-plt.savefig("energy_distribution.png")
-plt.close()
-
-# Biome tolerance trends (avg tolerance sum per biome per generation)
-df_biomes = pd.DataFrame(biome_tolerance_avg, index=gen_list)
-df_biomes.plot(kind="area", stacked=True, figsize=(10, 6), colormap="coolwarm", alpha=0.7)
-plt.xlabel("Generation")
-plt.ylabel("Avg Biome Tolerance Sum")
-plt.title("Biome Tolerance Trends Over Generations")
-plt.legend(title="Biome")
-plt.grid(True)
-plt.savefig("biome_trends.png")
-plt.close()
-
-# Food availability over time
-plt.figure(figsize=(10, 5))
-plt.plot(gen_list, average_food_per_generation, label="Avg Food", color="orange", linewidth=2)
-plt.xlabel("Generation")
-plt.ylabel("Average Food Availability")
-plt.title("Food Availability Trends Over Generations")
-plt.legend()
-plt.grid(True)
-plt.savefig("food_trends.png")
-plt.close()
-
-# Food heatmap (last snapshot)
-food_grid = np.array(last_food).reshape(height, width)
-plt.figure(figsize=(8, 6))
-sns.heatmap(food_grid, cmap="YlGnBu", square=True)
-plt.title(f"Food Availability Heatmap (Generation {gen_list[-1]})")
-plt.xlabel("X Position")
-plt.ylabel("Y Position")
-plt.savefig("food_heatmap.png")
-plt.close()
-
-# Traits evolution
-fig, axes = plt.subplots(3, 1, figsize=(10, 12))
-axes[0].plot(gen_list, organism_avg_size_list, label="Preys - Avg Size", color="lime", linewidth=2)
-axes[0].plot(gen_list, predator_avg_size_list, label="Predators - Avg Size", color="red", linewidth=2)
-axes[0].set_ylabel("Size")
-axes[0].set_title("Evolution of Size Over Generations")
-axes[0].legend()
-axes[0].grid(True)
-
-axes[1].plot(gen_list, organism_avg_speed_list, label="Preys - Avg Speed", color="blue", linewidth=2)
-axes[1].plot(gen_list, predator_avg_speed_list, label="Predators - Avg Speed", color="orange", linewidth=2)
-axes[1].set_ylabel("Speed")
-axes[1].set_title("Evolution of Speed Over Generations")
-axes[1].legend()
-axes[1].grid(True)
-
-axes[2].plot(gen_list, organism_avg_energy_list, label="Preys - Avg Energy", color="yellow", linewidth=2)
-axes[2].plot(gen_list, predator_avg_energy_list, label="Predators - Avg Energy", color="blue", linewidth=2)
-axes[2].set_xlabel("Generation")
-axes[2].set_ylabel("Energy")
-axes[2].set_title("Evolution of Energy Over Generations")
-axes[2].legend()
-axes[2].grid(True)
-
-plt.tight_layout()
-plt.savefig("traits_evolution.png")
-plt.close()
-
-# Reproduction threshold
-plt.figure(figsize=(10, 5))
-plt.plot(gen_list, organism_avg_reproduction_threshold_list, label="Preys", color="lime", linewidth=2)
-plt.plot(gen_list, predator_avg_reproduction_threshold_list, label="Predators", color="red", linewidth=2)
-plt.xlabel("Generation")
-plt.ylabel("Reproduction Threshold")
-plt.title("Reproduction Threshold Evolution Over Generations")
-plt.legend()
-plt.grid(True)
-plt.savefig("reproduction_threshold_trends.png")
-plt.close()
-
-# Predator hunting efficiency
-plt.figure(figsize=(10, 5))
-plt.plot(gen_list, predator_avg_hunting_efficiency_list, label="Predators - Hunting Efficiency", color="blue", linewidth=2)
-plt.xlabel("Generation")
-plt.ylabel("Hunting Efficiency")
-plt.title("Predator Hunting Efficiency Over Generations")
-plt.legend()
-plt.grid(True)
-plt.savefig("hunting_efficiency_trends.png")
-plt.close()
-
-df = pd.DataFrame({
-    "Generation": gen_list,
-    "Organism Size": organism_avg_size_list,
-    "Predator Size": predator_avg_size_list,
-    "Organism Speed": organism_avg_speed_list,
-    "Predator Speed": predator_avg_speed_list,
-    "Organism Energy": organism_avg_energy_list,
-    "Predator Energy": predator_avg_energy_list,
-    "Organism Reproduction Threshold": organism_avg_reproduction_threshold_list,
-    "Predator Hunting Efficiency": predator_avg_hunting_efficiency_list,
-})
-print("DataFrame head:\n", df.head())
-print("Done. Plots saved.")
+def plot_biome_map(world_biome_grid, width, height):
+    # Biome map: one imshow with a categorical colormap instead of W*H
+    # Rectangle patches
+    biome_cmap = ListedColormap([BIOME_COLORS[i] for i in range(len(BIOME_NAMES))])
+    fig, ax = plt.subplots(figsize=(max(width / 10, 4), max(height / 10, 4)))
+    ax.imshow(
+        world_biome_grid,
+        cmap=biome_cmap,
+        origin="lower",
+        interpolation="nearest",
+        vmin=0,
+        vmax=len(BIOME_NAMES) - 1,
+        aspect="equal",
+    )
+    ax.set_title("World Biome Map")
+    ax.set_xlabel("X Position")
+    ax.set_ylabel("Y Position")
+    ax.legend(
+        handles=[
+            plt.Line2D([0], [0], marker="o", color="w", label=name, markerfacecolor=BIOME_COLORS[i])
+            for name, i in BIOME_IDX.items()
+        ],
+        loc="upper right",
+    )
+    fig.tight_layout()
+    fig.savefig("world_biome_map.png")
+    plt.close(fig)
+
+
+def plot_population_trends(gen_list, organism_counts, predator_counts):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(gen_list, organism_counts, label="Preys", color="lime", linewidth=2)
+    ax.plot(gen_list, predator_counts, label="Predators", color="red", linewidth=2)
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Population")
+    ax.set_title("Population Over Time")
+    ax.legend()
+    ax.grid(True)
+    fig.savefig("population_trends.png")
+    plt.close(fig)
+
+
+def plot_population_heatmap(heatmap_grid):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    # imshow blits one image instead of seaborn's W*H-cell QuadMesh
+    im = ax.imshow(heatmap_grid, cmap="hot", interpolation="nearest", aspect="equal")
+    fig.colorbar(im, ax=ax)
+    ax.set_title("Population Heatmap (cumulative)")
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    fig.savefig("population_heatmap.png")
+    plt.close(fig)
+
+
+def plot_energy_distribution(organism_avg_energy, predator_avg_energy):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    for arr, color, label in (
+        (organism_avg_energy, "lime", "Preys"),
+        (predator_avg_energy, "red", "Predators"),
+    ):
+        counts, edges = np.histogram(arr, bins=30, density=True)
+        ax.bar(
+            edges[:-1], counts, width=np.diff(edges), align="edge",
+            color=color, alpha=0.7, label=label,
+        )
+        # smoothed curve via one scipy KDE evaluated on a fixed grid;
+        # fit on at most 10k samples so long runs stay cheap
+        if len(arr) > 1 and np.ptp(arr) > 0:
+            sample = arr
+            if len(sample) > 10_000:
+                sample = np.random.default_rng(0).choice(sample, 10_000, replace=False)
+            xs = np.linspace(edges[0], edges[-1], 200)
+            ax.plot(xs, gaussian_kde(sample, bw_method="scott")(xs), color=color)
+    ax.set_xlabel("Avg Energy")
+    ax.set_ylabel("Density")
+    ax.set_title("Energy Distribution of Preys and Predators")
+    ax.legend()
+    ax.grid(True)
+    fig.savefig("energy_distribution.png")
+    plt.close(fig)
+
+
+def plot_biome_trends(gen_list, biome_tolerance):
+    # Biome tolerance trends (avg tolerance sum per biome per generation);
+    # biome_tolerance holds the (n_gens, 4) columns in BIOME_NAMES order
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = plt.get_cmap("coolwarm")(np.linspace(0, 1, len(BIOME_NAMES)))
+    ax.stackplot(gen_list, biome_tolerance.T, labels=BIOME_NAMES, colors=colors, alpha=0.7)
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Avg Biome Tolerance Sum")
+    ax.set_title("Biome Tolerance Trends Over Generations")
+    ax.legend(title="Biome")
+    ax.grid(True)
+    fig.savefig("biome_trends.png")
+    plt.close(fig)
+
+
+def plot_food_trends(gen_list, average_food_per_generation):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(gen_list, average_food_per_generation, label="Avg Food", color="orange", linewidth=2)
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Average Food Availability")
+    ax.set_title("Food Availability Trends Over Generations")
+    ax.legend()
+    ax.grid(True)
+    fig.savefig("food_trends.png")
+    plt.close(fig)
+
+
+def plot_food_heatmap(food_grid, last_generation):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    im = ax.imshow(food_grid, cmap="YlGnBu", interpolation="nearest", aspect="equal")
+    fig.colorbar(im, ax=ax)
+    ax.set_title(f"Food Availability Heatmap (Generation {last_generation})")
+    ax.set_xlabel("X Position")
+    ax.set_ylabel("Y Position")
+    fig.savefig("food_heatmap.png")
+    plt.close(fig)
+
+
+def plot_traits_evolution(gen_list, org_size, pred_size, org_speed, pred_speed, org_energy, pred_energy):
+    fig, axes = plt.subplots(3, 1, figsize=(10, 12))
+    axes[0].plot(gen_list, org_size, label="Preys - Avg Size", color="lime", linewidth=2)
+    axes[0].plot(gen_list, pred_size, label="Predators - Avg Size", color="red", linewidth=2)
+    axes[0].set_ylabel("Size")
+    axes[0].set_title("Evolution of Size Over Generations")
+    axes[0].legend()
+    axes[0].grid(True)
+
+    axes[1].plot(gen_list, org_speed, label="Preys - Avg Speed", color="blue", linewidth=2)
+    axes[1].plot(gen_list, pred_speed, label="Predators - Avg Speed", color="orange", linewidth=2)
+    axes[1].set_ylabel("Speed")
+    axes[1].set_title("Evolution of Speed Over Generations")
+    axes[1].legend()
+    axes[1].grid(True)
+
+    axes[2].plot(gen_list, org_energy, label="Preys - Avg Energy", color="yellow", linewidth=2)
+    axes[2].plot(gen_list, pred_energy, label="Predators - Avg Energy", color="blue", linewidth=2)
+    axes[2].set_xlabel("Generation")
+    axes[2].set_ylabel("Energy")
+    axes[2].set_title("Evolution of Energy Over Generations")
+    axes[2].legend()
+    axes[2].grid(True)
+
+    fig.tight_layout()
+    fig.savefig("traits_evolution.png")
+    plt.close(fig)
+
+
+def plot_reproduction_threshold(gen_list, org_threshold, pred_threshold):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(gen_list, org_threshold, label="Preys", color="lime", linewidth=2)
+    ax.plot(gen_list, pred_threshold, label="Predators", color="red", linewidth=2)
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Reproduction Threshold")
+    ax.set_title("Reproduction Threshold Evolution Over Generations")
+    ax.legend()
+    ax.grid(True)
+    fig.savefig("reproduction_threshold_trends.png")
+    plt.close(fig)
+
+
+def plot_hunting_efficiency(gen_list, hunting_efficiency):
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(gen_list, hunting_efficiency, label="Predators - Hunting Efficiency", color="blue", linewidth=2)
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Hunting Efficiency")
+    ax.set_title("Predator Hunting Efficiency Over Generations")
+    ax.legend()
+    ax.grid(True)
+    fig.savefig("hunting_efficiency_trends.png")
+    plt.close(fig)
+
+
+def main():
+    # -----------------------------------------------------------------------
+    # 1. Time-series stats from summary_data.jsonl (lightweight,
+    #    pre-aggregated)
+    # -----------------------------------------------------------------------
+    summary = load_cached(SUMMARY_FILE, load_summary_data)["summary"]
+    (
+        gen_list,
+        organism_counts,
+        predator_counts,
+        organism_avg_size_list,
+        organism_avg_speed_list,
+        organism_avg_energy_list,
+        organism_avg_reproduction_threshold_list,
+        predator_avg_size_list,
+        predator_avg_speed_list,
+        predator_avg_energy_list,
+        predator_avg_reproduction_threshold_list,
+        predator_avg_hunting_efficiency_list,
+        predator_avg_satiation_threshold_list,
+        average_food_per_generation,
+    ) = summary[:, : len(SUMMARY_FIELDS)].T
+    gen_list = gen_list.astype(int)
+    # biome_tally values are avg biome tolerance sums per generation;
+    # (n_gens, 4) columns in BIOME_NAMES order
+    biome_tolerance = summary[:, len(SUMMARY_FIELDS):]
+
+    # -----------------------------------------------------------------------
+    # 2. Spatial data from world_data.jsonl (biome map, heatmaps)
+    # -----------------------------------------------------------------------
+    world = load_cached(WORLD_FILE, load_world_data)
+    width, height = (int(v) for v in world["dims"])
+    world_biome_grid = world["biome_grid"]
+    heatmap_grid = world["heatmap"]
+    food_grid = world["food"]  # (height, width) grid from the final snapshot
+
+    # -----------------------------------------------------------------------
+    # 3. Render all figures in parallel — each renderer is independent once
+    #    the arrays are computed, and the Agg backend is process-safe.
+    # -----------------------------------------------------------------------
+    jobs = [
+        (plot_biome_map, (world_biome_grid, width, height)),
+        (plot_population_trends, (gen_list, organism_counts, predator_counts)),
+        (plot_population_heatmap, (heatmap_grid,)),
+        (plot_energy_distribution, (organism_avg_energy_list, predator_avg_energy_list)),
+        (plot_biome_trends, (gen_list, biome_tolerance)),
+        (plot_food_trends, (gen_list, average_food_per_generation)),
+        (plot_food_heatmap, (food_grid, gen_list[-1])),
+        (
+            plot_traits_evolution,
+            (
+                gen_list,
+                organism_avg_size_list,
+                predator_avg_size_list,
+                organism_avg_speed_list,
+                predator_avg_speed_list,
+                organism_avg_energy_list,
+                predator_avg_energy_list,
+            ),
+        ),
+        (
+            plot_reproduction_threshold,
+            (gen_list, organism_avg_reproduction_threshold_list, predator_avg_reproduction_threshold_list),
+        ),
+        (plot_hunting_efficiency, (gen_list, predator_avg_hunting_efficiency_list)),
+    ]
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(fn, *args) for fn, args in jobs]
+        for future in futures:
+            future.result()
+
+    # final-generation sanity printout straight from the arrays
+    print(
+        f"Final generation {gen_list[-1]}: "
+        f"{int(organism_counts[-1])} preys, {int(predator_counts[-1])} predators, "
+        f"avg prey size {organism_avg_size_list[-1]:.3f}, "
+        f"avg predator size {predator_avg_size_list[-1]:.3f}, "
+        f"avg food {average_food_per_generation[-1]:.3f}"
+    )
+    print("Done. Plots saved.")
+
+
+if __name__ == "__main__":
+    main()